@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 
+import functools
+import hashlib
 import json
 import os
-from collections import defaultdict, Counter
-import matplotlib.pyplot as plt
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 
+try:
+    from orjson import loads as json_loads  # C parser; same dicts, errors subclass json.JSONDecodeError
+except ImportError:
+    json_loads = json.loads
+
 def map_labels_to_scores():
     """Map categorical labels to 1-5 numerical scores."""
     
@@ -46,73 +54,225 @@ def map_labels_to_scores():
         'novelty': novelty_mapping
     }
 
-def calculate_distributions():
-    """Calculate distribution for each field in human_labels JSON files, comparing first and second rounds."""
+# Plot style: the seaborn-v0_8-whitegrid stylesheet inlined, followed by our overrides,
+# so no stylesheet has to be located and parsed at run time
+PLOT_RC = {
+    # seaborn-v0_8-whitegrid
+    'figure.facecolor': 'white',
+    'text.color': '.15',
+    'axes.labelcolor': '.15',
+    'legend.frameon': False,
+    'legend.numpoints': 1,
+    'legend.scatterpoints': 1,
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'axes.axisbelow': True,
+    'image.cmap': 'Greys',
+    'font.sans-serif': ['Arial', 'Liberation Sans', 'DejaVu Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'grid.linestyle': '-',
+    'lines.solid_capstyle': 'round',
+    'axes.grid': True,
+    'axes.facecolor': 'white',
+    'axes.edgecolor': '.8',
+    'grid.color': '.8',
+    'xtick.major.size': 0,
+    'ytick.major.size': 0,
+    'xtick.minor.size': 0,
+    'ytick.minor.size': 0,
+    # Overrides
+    'font.family': 'DejaVu Sans',
+    'font.size': 8,
+    'axes.linewidth': 0.5,
+    'grid.linewidth': 0.5,
+    'lines.linewidth': 0.8,
+    'patch.linewidth': 0.5,
+    'xtick.major.width': 0.5,
+    'ytick.major.width': 0.5,
+    'xtick.minor.width': 0.3,
+    'ytick.minor.width': 0.3,
+}
+
+@functools.lru_cache(maxsize=None)
+def load_matplotlib():
+    """Import matplotlib and apply the plot style once.
     
-    labels_dir = "/Users/machang/Documents/research-work/CellMMAgent/Visualize_DeepResearch/human_labels"
-    total_files = 0
+    Deferred until plotting so that scanning labels (including in spawned
+    parse workers) does not pay matplotlib's ~0.3 s import cost. Only the
+    object-oriented API is used, so no pyplot state or GUI backend is set up.
+    """
+    import matplotlib as mpl
     
-    # Store individual scores for both rounds
-    score_data_first = {
-        'Evidence': [],
-        'Errors': [],
-        'Single Cell Analysis': [],
-        'Novelty': []
-    }
+    mpl.rcParams.update(PLOT_RC)
+    return mpl
+
+# Color scheme from the provided palette
+SCORE_COLORS = {
+    1: '#E58585',  # Coral/salmon (poor) - from RGB 229,133,119
+    3: '#F2B76F',  # Light orange (fair) - from RGB 242,187,124
+    2: '#FCB3D9',  # Light purple (fair) - from RGB 188,186,218
+    # 3: '#F8F8BB',  # Light yellow (neutral) - from RGB 250,248,187
+    4: '#BDD788',  # Light green/teal (good) - from RGB 156,207,198
+    5: '#B2E1F6'   # Light blue (excellent) - from RGB 138,176,207
+}
+
+@functools.lru_cache(maxsize=None)
+def legend_handles():
+    """Build the (score color, method) legend proxy patches once and reuse them across plots."""
+    from matplotlib.patches import Rectangle
     
-    score_data_second = {
-        'Evidence': [],
-        'Errors': [],
-        'Single Cell Analysis': [],
-        'Novelty': []
-    }
+    # First legend group for score categories (colors)
+    color_legend_elements = (
+        Rectangle((0,0),1,1, facecolor=SCORE_COLORS[1], label='Poor', edgecolor='gainsboro', linewidth=0.5),
+        Rectangle((0,0),1,1, facecolor=SCORE_COLORS[2], label='Fair', edgecolor='gainsboro', linewidth=0.5), 
+        Rectangle((0,0),1,1, facecolor=SCORE_COLORS[3], label='Neutral', edgecolor='gainsboro', linewidth=0.5),
+        Rectangle((0,0),1,1, facecolor=SCORE_COLORS[4], label='Good', edgecolor='gainsboro', linewidth=0.5),
+        Rectangle((0,0),1,1, facecolor=SCORE_COLORS[5], label='Excellent', edgecolor='gainsboro', linewidth=0.5)
+    )
+    
+    # Second legend group for method indicators (line types)
+    method_legend_elements = (
+        Rectangle((0,0),1,1, facecolor='white', label='AgentSee', edgecolor='black', linewidth=0.5),
+        Rectangle((0,0),1,1, facecolor='white', hatch='///', label='Human Review + AgentSee', edgecolor='black', linewidth=0.5)
+    )
+    return color_legend_elements, method_legend_elements
+
+# Scored label fields as (JSON key, criterion name), in column order of the encoded score matrix
+SCORE_FIELDS = (
+    ('evidence', 'Evidence'),
+    ('errors', 'Errors'),
+    ('singlecell', 'Single Cell Analysis'),
+    ('novelty', 'Novelty'),
+)
+
+def encode_label_scores(data, mappings):
+    """Encode one label record as a tuple of 1-5 scores per scored field (0 = missing or unmapped)."""
+    return tuple(mappings[key].get(data.get(key), 0) for key, _ in SCORE_FIELDS)
+
+SCORE_MAPPINGS = map_labels_to_scores()
+
+# Below this many label files, process-pool startup costs more than parsing serially
+PARALLEL_PARSE_MIN_FILES = 1000
+
+def parse_label_file(path):
+    """Read one label file and return (encoded scores, None), or (None, error) if it can't be read."""
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            data = json_loads(f.read())
+    except (json.JSONDecodeError, FileNotFoundError) as e:
+        return None, e
+    return encode_label_scores(data, SCORE_MAPPINGS), None
+
+# Encoded scores are cached next to the label files and reused until any label file
+# or the encoding (cache layout, SCORE_FIELDS, SCORE_MAPPINGS) changes
+LABELS_CACHE_NAME = 'labels.cache.npz'
+LABELS_CACHE_VERSION = 1
+
+def labels_signature(label_entries):
+    """Fingerprint label files by name, size and mtime (from the DirEntry stat cache), plus the score encoding."""
+    stats = []
+    for entry in label_entries:
+        st = entry.stat()
+        stats.append((entry.name, st.st_size, st.st_mtime_ns))
+    stats.sort()
+    encoding = (LABELS_CACHE_VERSION, SCORE_FIELDS, SCORE_MAPPINGS)
+    return hashlib.blake2b(repr((encoding, stats)).encode()).hexdigest()
+
+def scan_labels(labels_dir):
+    """Return encoded score rows for the first and second rounds plus any read errors.
+    
+    Parsed results are stored in LABELS_CACHE_NAME inside labels_dir and loaded
+    directly on later runs as long as no label file was added, removed or modified.
+    """
+    # Collect the label files up front (scandir DirEntries carry the full path and
+    # cached file type, so no extra stat per entry) and release the directory handle
+    with os.scandir(labels_dir) as it:
+        label_entries = [entry for entry in it
+                         if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)]
+    
+    signature = labels_signature(label_entries)
+    cache_path = os.path.join(labels_dir, LABELS_CACHE_NAME)
+    try:
+        with np.load(cache_path) as cache:
+            if cache['signature'] == signature:
+                return cache['first'], cache['second'], list(cache['errors'])
+    except (OSError, EOFError, zipfile.BadZipFile, KeyError, ValueError):
+        pass  # No usable cache (missing, empty, truncated or stale format); parse the label files below
+    
+    # Encoded score rows, preallocated with one row per label file, plus a parse-success flag
+    codes = np.zeros((len(label_entries), len(SCORE_FIELDS)), dtype=np.int8)
+    parsed = np.zeros(len(label_entries), dtype=bool)
+    errors = []
     
-    # Get score mappings
-    mappings = map_labels_to_scores()
+    # Determine if this is first round (no underscore after attempt_X) or second round (has _Y suffix)
+    # from the entry names alone, before any file is opened
+    # First round: labels_attempt_X.json
+    # Second round: labels_attempt_X_Y.json (3+ underscores)
+    is_second_round = np.array([entry.name.count('_') >= 3 for entry in label_entries], dtype=bool)
     
-    # Process all JSON files in the human_labels directory
-    for filename in os.listdir(labels_dir):
-        if filename.endswith('.json'):
-            filepath = os.path.join(labels_dir, filename)
+    # Parse all JSON files in the human_labels directory; files are independent,
+    # so large corpora are spread across worker processes
+    paths = [entry.path for entry in label_entries]
+    if len(paths) >= PARALLEL_PARSE_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(parse_label_file, paths, chunksize=64))
+    else:
+        results = map(parse_label_file, paths)
+    
+    for i, (entry, (scores, error)) in enumerate(zip(label_entries, results)):
+        if error is not None:
+            errors.append(f"Error reading {entry.name}: {error}")
+            continue
+        
+        # Null/empty/unknown values are encoded as 0 and dropped later
+        codes[i] = scores
+        parsed[i] = True
+    
+    first = codes[parsed & ~is_second_round]
+    second = codes[parsed & is_second_round]
+    
+    # Write to a uniquely named temporary file first, so neither an interrupted run nor
+    # a concurrent one can leave a truncated cache in place
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=labels_dir, prefix=LABELS_CACHE_NAME + '.',
+                                         suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            np.savez(f, signature=signature, first=first, second=second,
+                     errors=np.array(errors, dtype=str))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Could not write labels cache {cache_path}: {e}")
+        if tmp_path is not None:
             try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    total_files += 1
-                    
-                    # Determine if this is first round (no underscore after attempt_X) or second round (has _Y suffix)
-                    # First round: labels_attempt_X.json
-                    # Second round: labels_attempt_X_Y.json
-                    is_second_round = filename.count('_') >= 3  # labels_attempt_X_Y has 3+ underscores
-                    
-                    # Choose appropriate data structure
-                    current_score_data = score_data_second if is_second_round else score_data_first
-                    
-                    # Count values for each field, excluding null/empty values
-                    for key, value in data.items():
-                        if key in ['attemptId', 'geneName', 'timestamp', 'explore', 'comments']:
-                            continue  # Skip ID and non-scoring fields
-                        
-                        if value is not None and value != "" and value != "null":
-                            # Map to scores if applicable
-                            if key in mappings and value in mappings[key]:
-                                score = mappings[key][value]
-                                
-                                # Store individual scores
-                                if key == 'evidence':
-                                    current_score_data['Evidence'].append(score)
-                                elif key == 'errors':
-                                    current_score_data['Errors'].append(score)
-                                elif key == 'singlecell':
-                                    current_score_data['Single Cell Analysis'].append(score)
-                                elif key == 'novelty':
-                                    current_score_data['Novelty'].append(score)
-            
-            except (json.JSONDecodeError, FileNotFoundError) as e:
-                print(f"Error reading {filename}: {e}")
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    return first, second, errors
+
+def score_histograms(codes):
+    """Count scores 1-5 per criterion in an (n_files, 4) int8 matrix of encoded scores (0s are skipped)."""
+    return {criterion: np.bincount(codes[:, j], minlength=6)[1:6] for j, (_, criterion) in enumerate(SCORE_FIELDS)}
+
+def calculate_distributions():
+    """Calculate distribution for each field in human_labels JSON files, comparing first and second rounds."""
+    
+    labels_dir = "/Users/machang/Documents/research-work/CellMMAgent/Visualize_DeepResearch/human_labels"
+    
+    codes_first, codes_second, errors = scan_labels(labels_dir)
+    for error in errors:
+        print(error)
+    total_files = len(codes_first) + len(codes_second)
+    
+    # Score counts per criterion for both rounds, computed once and reused for the plot
+    score_counts_first = score_histograms(codes_first)
+    score_counts_second = score_histograms(codes_second)
     
     print(f"Analyzed {total_files} files")
-    print(f"First round files: {sum(len(scores) for scores in score_data_first.values())}")
-    print(f"Second round files: {sum(len(scores) for scores in score_data_second.values())}")
+    print(f"First round files: {sum(counts.sum() for counts in score_counts_first.values())}")
+    print(f"Second round files: {sum(counts.sum() for counts in score_counts_second.values())}")
     print("=" * 50)
     
     # Create plots directory for plots
@@ -124,41 +284,26 @@ def calculate_distributions():
     criteria_with_data = []
     
     # Find criteria that have data in either round
-    all_criteria = set(score_data_first.keys()) | set(score_data_second.keys())
+    all_criteria = set(score_counts_first.keys()) | set(score_counts_second.keys())
     for criterion in all_criteria:
-        if (criterion in score_data_first and score_data_first[criterion]) or \
-           (criterion in score_data_second and score_data_second[criterion]):
+        if (criterion in score_counts_first and score_counts_first[criterion].any()) or \
+           (criterion in score_counts_second and score_counts_second[criterion].any()):
             criteria_with_data.append(criterion)
     
     if criteria_with_data:
-        # Set up single figure for grouped comparison
-        plt.figure(figsize=(6, 3))
-        plt.style.use('seaborn-v0_8-whitegrid')
-        plt.rcParams.update({
-            'font.family': 'DejaVu Sans',
-            'font.size': 8,
-            'axes.linewidth': 0.5,
-            'grid.linewidth': 0.5,
-            'lines.linewidth': 0.8,
-            'patch.linewidth': 0.5,
-            'xtick.major.width': 0.5,
-            'ytick.major.width': 0.5,
-            'xtick.minor.width': 0.3,
-            'ytick.minor.width': 0.3,
-        })
+        load_matplotlib()
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import PatchCollection
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Rectangle
         
-        # Color scheme from the provided palette
-        score_colors = {
-            1: '#E58585',  # Coral/salmon (poor) - from RGB 229,133,119
-            3: '#F2B76F',  # Light orange (fair) - from RGB 242,187,124
-            2: '#FCB3D9',  # Light purple (fair) - from RGB 188,186,218
-            # 3: '#F8F8BB',  # Light yellow (neutral) - from RGB 250,248,187
-            4: '#BDD788',  # Light green/teal (good) - from RGB 156,207,198
-            5: '#B2E1F6'   # Light blue (excellent) - from RGB 138,176,207
-        }
+        # Set up single figure for grouped comparison, rendered headless by Agg
+        fig = Figure(figsize=(6, 3))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
         
         # Create grouped data - each criterion appears twice (first round, then second round)
-        proportions_data_grouped = []
+        counts_grouped = []
         labels_grouped = []
         use_hatching = []
         y_positions = []
@@ -170,34 +315,14 @@ def calculate_distributions():
         
         for criterion in criteria_with_data:
             # First round data
-            scores_first = score_data_first.get(criterion, [])
-            if scores_first:
-                score_counts = Counter(scores_first)
-                total = len(scores_first)
-                proportions_first = []
-                for score in range(1, 6):
-                    proportion = score_counts.get(score, 0) / total
-                    proportions_first.append(proportion)
-                proportions_data_grouped.append(proportions_first)
-            else:
-                proportions_data_grouped.append([0, 0, 0, 0, 0])
+            counts_grouped.append(score_counts_first[criterion])
             labels_grouped.append(f"{criterion}")
             use_hatching.append(False)
             y_positions.append(current_y)
             
             # Second round data (touching the first round bar)
             current_y += bar_width  # Move by exactly bar width to make them touch
-            scores_second = score_data_second.get(criterion, [])
-            if scores_second:
-                score_counts = Counter(scores_second)
-                total = len(scores_second)
-                proportions_second = []
-                for score in range(1, 6):
-                    proportion = score_counts.get(score, 0) / total
-                    proportions_second.append(proportion)
-                proportions_data_grouped.append(proportions_second)
-            else:
-                proportions_data_grouped.append([0, 0, 0, 0, 0])
+            counts_grouped.append(score_counts_second[criterion])
             labels_grouped.append(f"{criterion}")
             use_hatching.append(True)
             y_positions.append(current_y)
@@ -205,55 +330,46 @@ def calculate_distributions():
             # Move to next group
             current_y += bar_width + group_spacing
         
-        if proportions_data_grouped:
+        if counts_grouped:
             # Create grouped stacked bar chart
             width = bar_width  # Use the same width as defined above
             
-            for i, proportions in enumerate(proportions_data_grouped):
-                if any(p > 0 for p in proportions):  # Only plot if there's data
-                    # Left side (<=3) - poor, fair, and neutral
-                    left_total = proportions[0] + proportions[1] + proportions[2]
-                    left_start = -left_total
-                    
-                    # Choose pattern based on round
-                    hatch_pattern = '///' if use_hatching[i] else None
-                    
-                    # Plot poor, fair, neutral on left side with thicker interior lines
-                    if proportions[0] > 0:
-                        plt.barh(y_positions[i], proportions[0], height=width, 
-                               left=left_start, color=score_colors[1], alpha=0.3,
-                               edgecolor='black', linewidth=1.0, hatch=hatch_pattern)
-                    if proportions[1] > 0:
-                        plt.barh(y_positions[i], proportions[1], height=width,
-                               left=left_start + proportions[0], color=score_colors[2], alpha=0.3,
-                               edgecolor='black', linewidth=1.0, hatch=hatch_pattern)
-                    if proportions[2] > 0:
-                        plt.barh(y_positions[i], proportions[2], height=width,
-                               left=left_start + proportions[0] + proportions[1], color=score_colors[3], alpha=0.3,
-                               edgecolor='black', linewidth=1.0, hatch=hatch_pattern)
-                    
-                    # Right side (>3) - good and excellent with thicker interior lines
-                    right_start = 0
-                    if proportions[3] > 0:
-                        plt.barh(y_positions[i], proportions[3], height=width,
-                               left=right_start, color=score_colors[4], alpha=0.3,
-                               edgecolor='black', linewidth=1.0, hatch=hatch_pattern)
-                    if proportions[4] > 0:
-                        plt.barh(y_positions[i], proportions[4], height=width,
-                               left=right_start + proportions[3], color=score_colors[5], alpha=0.3,
-                               edgecolor='black', linewidth=1.0, hatch=hatch_pattern)
-                    
-                    # Draw thicker outline around the entire bar
-                    total_left = left_total
-                    total_right = proportions[3] + proportions[4]
-                    
-                    # Outer box with much thicker lines (3x thicker)
-                    from matplotlib.patches import Rectangle
-                    full_width = total_left + total_right
-                    rect = Rectangle((-total_left, y_positions[i] - width/2), 
-                                   full_width, width, 
-                                   fill=False, edgecolor='black', linewidth=1.0)
-                    plt.gca().add_patch(rect)
+            # Proportions of scores 1-5 for all bars at once; bars without data stay all zero
+            counts = np.stack(counts_grouped)  # shape (n_bars, 5)
+            totals = counts.sum(axis=1, keepdims=True)
+            props = np.divide(counts, totals, out=np.zeros(counts.shape), where=totals > 0)
+            y = np.asarray(y_positions, dtype=float)
+            hatched = np.asarray(use_hatching)
+            has_data = (props > 0).any(axis=1)  # Only plot bars that have data
+            
+            # Left edge of every segment: poor, fair and neutral (<=3) stack leftwards
+            # from 0, good and excellent (>3) stack rightwards
+            left_start = -(props[:, 0] + props[:, 1] + props[:, 2])
+            lefts = np.column_stack([
+                left_start,
+                left_start + props[:, 0],
+                left_start + props[:, 0] + props[:, 1],
+                np.zeros(len(props)),
+                props[:, 3],
+            ])
+            
+            # One barh call per score layer across all bars, with thicker interior lines;
+            # the second round is hatched
+            for k in range(5):
+                mask = props[:, k] > 0
+                if not mask.any():
+                    continue
+                bars = ax.barh(y[mask], props[mask, k], height=width,
+                               left=lefts[mask, k], color=SCORE_COLORS[k + 1], alpha=0.3,
+                               edgecolor='black', linewidth=1.0)
+                for bar, is_hatched in zip(bars, hatched[mask]):
+                    if is_hatched:
+                        bar.set_hatch('///')
+            
+            # Draw thicker outline around each entire bar, all in one collection
+            outlines = [Rectangle((left_start[i], y[i] - width/2), lefts[i, 4] + props[i, 4] - left_start[i], width)
+                        for i in np.flatnonzero(has_data)]
+            ax.add_collection(PatchCollection(outlines, facecolor='none', edgecolor='black', linewidth=1.0))
             
             # No title - removed as requested
             
@@ -281,20 +397,19 @@ def calculate_distributions():
                 group_labels.append(descriptive_label)
                 group_positions.append(middle_pos)
             
-            plt.yticks(group_positions, group_labels, fontsize=8, color='black')
-            plt.axvline(x=0, color='black', linewidth=2, alpha=0.3)
+            ax.set_yticks(group_positions, group_labels, fontsize=8, color='black')
+            ax.axvline(x=0, color='black', linewidth=2, alpha=0.3)
             
             max_range = 0.9
             padding = 0.05  # Add padding to prevent cutoff
-            plt.xlim(-0.7 * max_range - padding, max_range + padding)
+            ax.set_xlim(-0.7 * max_range - padding, max_range + padding)
             
             # Set y-axis limits to accommodate all groups with padding
             y_padding = 0.3  # Extra padding for y-axis
-            plt.ylim(-y_padding, max(y_positions) + bar_width + y_padding)
+            ax.set_ylim(-y_padding, max(y_positions) + bar_width + y_padding)
             
-            plt.grid(False)
+            ax.grid(False)
             
-            ax = plt.gca()
             ax.set_facecolor('white')
             ax.spines['top'].set_visible(False)
             ax.spines['right'].set_visible(False)
@@ -304,44 +419,27 @@ def calculate_distributions():
             ax.spines['bottom'].set_linewidth(0.5)
             
             # Add 50% markers on x-axis
-            plt.xticks([-0.5, 0, 0.5], ['50%', '0%', '50%'], fontsize=8, color='black')
-            plt.xlabel('')
-            plt.ylabel('')
+            ax.set_xticks([-0.5, 0, 0.5], ['50%', '0%', '50%'], fontsize=8, color='black')
+            ax.set_xlabel('')
+            ax.set_ylabel('')
             
             # Create two separate legend groups without boxes
-            
-            # First legend group for score categories (colors)
-            color_legend_elements = [
-                plt.Rectangle((0,0),1,1, facecolor=score_colors[1], label='Poor', edgecolor='gainsboro', linewidth=0.5),
-                plt.Rectangle((0,0),1,1, facecolor=score_colors[2], label='Fair', edgecolor='gainsboro', linewidth=0.5), 
-                plt.Rectangle((0,0),1,1, facecolor=score_colors[3], label='Neutral', edgecolor='gainsboro', linewidth=0.5),
-                plt.Rectangle((0,0),1,1, facecolor=score_colors[4], label='Good', edgecolor='gainsboro', linewidth=0.5),
-                plt.Rectangle((0,0),1,1, facecolor=score_colors[5], label='Excellent', edgecolor='gainsboro', linewidth=0.5)
-            ]
-            
-            # Second legend group for method indicators (line types)
-            method_legend_elements = [
-                plt.Rectangle((0,0),1,1, facecolor='white', label='AgentSee', edgecolor='black', linewidth=0.5),
-                plt.Rectangle((0,0),1,1, facecolor='white', hatch='///', label='Human Review + AgentSee', edgecolor='black', linewidth=0.5)
-            ]
+            color_legend_elements, method_legend_elements = legend_handles()
             
             # Create first legend for colors (no box) - positioned at top center
-            first_legend = plt.legend(handles=color_legend_elements, loc='upper center', 
+            first_legend = ax.legend(handles=color_legend_elements, loc='upper center', 
                                     bbox_to_anchor=(0.5, 1.17), ncol=5, frameon=False,
                                     fontsize=7)
             
             # Add the first legend back to the plot
-            plt.gca().add_artist(first_legend)
+            ax.add_artist(first_legend)
             
             # Create second legend for methods (no box) - positioned at top center
-            plt.legend(handles=method_legend_elements, loc='upper center', 
+            ax.legend(handles=method_legend_elements, loc='upper center', 
                       bbox_to_anchor=(0.5, 1.12), ncol=2, frameon=False,
                       fontsize=7)
             
             # Add a smaller black-edged box around both legends
-            from matplotlib.patches import Rectangle
-            ax = plt.gca()
-            
             # Calculate box dimensions to fit snugly around the legends
             legend_box = Rectangle((-0.1, 1.02), 1.2, 0.13, 
                                  transform=ax.transAxes, 
@@ -349,23 +447,24 @@ def calculate_distributions():
                                  clip_on=False)
             ax.add_patch(legend_box)
             
-            plt.tight_layout(pad=2.0)  # Add padding around the entire plot
+            fig.tight_layout(pad=2.0)  # Add padding around the entire plot
             
             # Save with Nature journal specifications
             stacked_plot_filename = os.path.join(plots_dir, "performance_stacked_distribution.png")
-            plt.savefig(stacked_plot_filename, dpi=600, bbox_inches='tight', 
+            fig.savefig(stacked_plot_filename, dpi=600, bbox_inches='tight', 
                        facecolor='white', edgecolor='none', format='png')
             
             # Save as PDF for publication
             stacked_plot_filename_pdf = os.path.join(plots_dir, "performance_stacked_distribution.pdf")
-            plt.savefig(stacked_plot_filename_pdf, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none', format='pdf')
+            # No creation date stamp, so an unchanged figure saves to identical PDF bytes
+            fig.savefig(stacked_plot_filename_pdf, bbox_inches='tight', 
+                       facecolor='white', edgecolor='none', format='pdf',
+                       metadata={'CreationDate': None})
             
             # Also save as vector format for publication
             stacked_plot_filename_eps = os.path.join(plots_dir, "performance_stacked_distribution.eps")
-            plt.savefig(stacked_plot_filename_eps, bbox_inches='tight', 
+            fig.savefig(stacked_plot_filename_eps, bbox_inches='tight', 
                        facecolor='white', edgecolor='none', format='eps')
-            plt.show()
             print(f"\nStacked bar plot saved as: {stacked_plot_filename}")
             print(f"PDF version saved as: {stacked_plot_filename_pdf}")
             print(f"EPS version saved as: {stacked_plot_filename_eps}")
@@ -7,16 +7,223 @@ and provide API endpoints for dynamic data loading.
 import os
 import json
 import re
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+import functools
+import gzip
+import datetime
+import email.utils
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import glob
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # C encoder/parser; dumps returns UTF-8 bytes
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+def json_dumps(data, indent=False):
+    """Encode data as compact UTF-8 JSON bytes, or indented by 2 spaces for files people read and diff"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Gene name patterns, compiled once: report_GENENAME_description.md, then generic GENE_ prefixes
+REPORT_GENE_RE = re.compile(r'report_([A-Z0-9]+)_')
+GENE_PATTERNS = (
+    re.compile(r'([A-Z][A-Z0-9]{2,8})_'),  # Standard gene names
+    re.compile(r'([A-Z]{3,8})_'),          # Alternative patterns
+)
+
+# Header phrases introducing the research hypothesis (matched in lowercased report lines;
+# '# research hypothesis' and '## research hypothesis' are covered by the first)
+HYPOTHESIS_PHRASES = ('research hypothesis', 'hypothesis:', 'research question')
+
+# Keywords marking evidence figures among PNG file names (matched case-insensitively)
+FIGURE_KEYWORDS = ('comprehensive', 'single', 'cell', 'segmentation', 'composite', 'comparison')
+
+# File types listed in /api/attempt/<id> (case-sensitive, as str.endswith suffixes)
+ATTEMPT_FILE_EXTENSIONS = ('.png', '.jpg', '.md', '.csv', '.json')
+
+# Common false positives for gene names taken from file names
+GENE_NAME_BLACKLIST = frozenset({'JUMP', 'RESEARCH', 'PROBLEM', 'VERIFIED'})
+PREFIX_BLACKLIST = frozenset({'TOP', 'ALL', 'CELL', 'IMAGE', 'DATA', 'RESULT', 'ANALYSIS',
+                              'FIGURE', 'TABLE', 'PLOT', 'GRAPH', 'CHART', 'SUMMARY'})
+
+# Markdown report syntax, compiled once for markdown_to_html and its table helpers
+MD_HEADER_RE = re.compile(r'^(#{1,4}) (.*?)$', re.MULTILINE)  # h1-h4 only; deeper levels stay text
+MD_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+MD_ITALIC_RE = re.compile(r'(?<!\*)\*([^*\n]+?)\*(?!\*)')
+MD_CODE_BLOCK_RE = re.compile(r'```([^`]*?)```', re.DOTALL)
+MD_INLINE_CODE_RE = re.compile(r'`([^`]+?)`')
+MD_CODE_PLACEHOLDER_RE = re.compile(r'\x00(\d+)\x00')
+MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+MD_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+# Anything the converter treats as markup other than paragraphs: header, emphasis, code, link
+# and table characters, or a line that starts (after whitespace) like a list item
+MD_SYNTAX_RE = re.compile(r'[#*`\[|]|^\s*(?:[-+] |\d+\. )', re.MULTILINE)
+MD_TABLE_SEPARATOR_RE = re.compile(r'^\|[\s\-\:\|]+\|$')
+
+# Unordered list item markers; ordered items are digits followed by '. '
+MD_UL_MARKERS = ('- ', '* ', '+ ')
+
+def header_html(match):
+    """Replacement for MD_HEADER_RE: the number of #s gives the header level"""
+    level = len(match.group(1))
+    return f'<h{level}>{match.group(2)}</h{level}>'
+
+# Request threads and the attempt-building pool store into the shared caches concurrently
+_CACHE_LOCK = threading.Lock()
+
+def cache_store(cache, key, value, max_entries):
+    """Store value in a dict cache, dropping its oldest entry once it holds max_entries"""
+    with _CACHE_LOCK:
+        if key not in cache and len(cache) >= max_entries:
+            cache.pop(next(iter(cache), None), None)
+        cache[key] = value
+
+# Directory listings per attempt by real path, reused until any directory in the attempt tree changes
+_ATTEMPT_SCANS = {}
+ATTEMPT_SCAN_CACHE_SIZE = 1024
+
+def _walk_attempt(directory, entries, files, dir_mtimes):
+    """Collect (root, name) for the files among entries and below, in os.walk order (symlinked dirs not followed)."""
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            subdirs.append(entry)
+        else:
+            files.append((directory, entry.name))
+    
+    for entry in subdirs:
+        if entry.is_symlink():
+            continue
+        try:
+            mtime = entry.stat().st_mtime_ns
+            with os.scandir(entry.path) as it:
+                sub_entries = list(it)
+        except OSError:
+            continue  # Unreadable subdirectories are skipped, as os.walk does
+        dir_mtimes.append((entry.path, mtime))
+        _walk_attempt(entry.path, sub_entries, files, dir_mtimes)
+
+def file_name_prefix(filename):
+    """File name without its extension, up to the first underscore"""
+    return os.path.splitext(filename)[0].split('_', 1)[0]
+
+def report_file_names(scan):
+    """Names matching report_*.md directly in the attempt directory, in listing order"""
+    return [name for name in scan['top'] if name.startswith('report_') and name.endswith('.md')]
+
+def scan_attempt(attempt_dir):
+    """List an attempt directory tree in one pass, shared by all per-attempt helpers.
+    
+    Returns a dict with 'top' (entry names directly in attempt_dir, in listing
+    order) and 'files' ((root, name) of every file in the tree, in os.walk order).
+    A cached scan is reused while every directory in the tree keeps its mtime,
+    which costs one stat per directory instead of listing it again. Values
+    derived from the listing alone are memoized in the scan (see scan_memo).
+    """
+    # Scans hold paths as spelled by the caller, so one taken through another
+    # spelling of the same directory is replaced rather than reused
+    key = os.path.realpath(attempt_dir)
+    cached = _ATTEMPT_SCANS.get(key)
+    if cached is not None and cached['dir_mtimes'][0][0] == attempt_dir:
+        try:
+            if all(os.stat(path).st_mtime_ns == mtime for path, mtime in cached['dir_mtimes']):
+                return cached
+        except OSError:
+            pass
+    
+    try:
+        top_mtime = os.stat(attempt_dir).st_mtime_ns
+    except OSError:
+        _ATTEMPT_SCANS.pop(key, None)  # Attempt directory removed
+        raise
+    with os.scandir(attempt_dir) as it:
+        top_entries = list(it)
+    
+    files = []
+    dir_mtimes = [(attempt_dir, top_mtime)]
+    _walk_attempt(attempt_dir, top_entries, files, dir_mtimes)
+    
+    scan = {
+        'top': [entry.name for entry in top_entries],
+        'files': files,
+        'dir_mtimes': dir_mtimes,
+    }
+    cache_store(_ATTEMPT_SCANS, key, scan, ATTEMPT_SCAN_CACHE_SIZE)
+    return scan
+
+@functools.lru_cache(maxsize=256)
+def _load_report(full_path, mtime_ns, size):
+    """Read a report; cached per (path, mtime, size), so an edited report is read again"""
+    with open(full_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def scan_memo(scan, key, compute, *args):
+    """Return scan[key], computing it with compute(*args) on first use.
+    
+    A changed directory tree gets a new scan, so memoized values are
+    recomputed exactly when the listing they derive from changes.
+    """
+    try:
+        return scan[key]
+    except KeyError:
+        value = scan[key] = compute(*args)
+        return value
+
+def attempts_signature(attempt_dirs, scans):
+    """Fingerprint everything /api/attempts is built from: the attempt directories,
+    the mtimes of every directory in each attempt tree and the size and mtime of each report"""
+    signature = []
+    for attempt_dir, scan in zip(attempt_dirs, scans):
+        report_stat = None
+        report_files = report_file_names(scan)
+        if report_files:
+            try:
+                st = os.stat(os.path.join(attempt_dir, report_files[0]))
+                report_stat = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+        signature.append((attempt_dir, tuple(mtime for _, mtime in scan['dir_mtimes']), report_stat))
+    return tuple(signature)
+
+# Threads for building attempts on a cache miss; reading reports releases the GIL while waiting on the file system
+ATTEMPT_BUILD_WORKERS = 16
+
+# Encoded /api/attempts response per data directory, as (signature, body, gzipped body)
+_ATTEMPTS_CACHE = {}
+
+# Smaller response bodies are sent uncompressed; gzip framing would outweigh the savings
+GZIP_MIN_SIZE = 1024
 
 class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
+    # Keep connections open between requests; every response sets Content-Length
+    protocol_version = 'HTTP/1.1'
+    
+    # Content-Length sent for the file the next copyfile() call sends, which bounds the copy
+    sendfile_size = None
+    
     def __init__(self, *args, **kwargs):
         self.data_dir = "/Users/machang/Documents/research-work/CellMMAgent/Visualize_DeepResearch/JUMPDiscovery_results"
         super().__init__(*args, **kwargs)
     
+    def log_request(self, code='-', size='-'):
+        """Log failed requests only, not every asset fetch and API poll"""
+        if isinstance(code, int) and code < 400:
+            return
+        super().log_request(code, size)
+    
     def do_GET(self):
         parsed_path = urlparse(self.path)
         
@@ -28,37 +235,127 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
         elif parsed_path.path == '/api/labels':
             self.handle_get_labels_api()
         elif parsed_path.path.endswith('.md'):
-            self.handle_markdown_file(parsed_path.path)
+            self.handle_markdown_file(parsed_path.path, parsed_path.query)
         else:
             # Serve static files
             super().do_GET()
     
+    def send_head(self):
+        """Serve static files with an ETag, answering 304 when the browser's copy is current"""
+        path = self.translate_path(self.path)
+        if path.endswith('/') or not os.path.isfile(path):
+            return super().send_head()  # Directories, redirects and missing files
+        
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+        
+        try:
+            fs = os.fstat(f.fileno())
+            etag = f'"{fs.st_mtime_ns:x}-{fs.st_size:x}"'
+            
+            # Figures can be regenerated while the visualizer is open, so browsers
+            # revalidate every time (no-cache) and get a bodyless 304 if unchanged;
+            # If-Modified-Since is only consulted without If-None-Match, as in the base class
+            if_none_match = self.headers.get('If-None-Match')
+            if if_none_match is not None:
+                tags = [tag.strip() for tag in if_none_match.split(',')]
+                not_modified = etag in tags or 'W/' + etag in tags or '*' in tags
+            else:
+                not_modified = self.not_modified_since(fs.st_mtime)
+            
+            if not_modified:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                f.close()
+                return None
+            
+            self.send_response(200)
+            self.send_header('Content-type', self.guess_type(path))
+            self.send_header('Content-Length', str(fs.st_size))
+            self.send_header('Last-Modified', self.date_time_string(fs.st_mtime))
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            self.sendfile_size = fs.st_size
+            return f
+        except Exception:
+            f.close()
+            raise
+    
+    def not_modified_since(self, mtime):
+        """Whether the If-Modified-Since header covers a file last modified at mtime (SimpleHTTPRequestHandler's check)"""
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is None:
+            return False
+        try:
+            ims = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False  # Ignore ill-formed values
+        if ims.tzinfo is None:
+            # Obsolete format with no timezone, cf. RFC 7231 section 7.1.1.1
+            ims = ims.replace(tzinfo=datetime.timezone.utc)
+        if ims.tzinfo is not datetime.timezone.utc:
+            return False
+        # Compare to the UTC time of last modification, without microseconds like the header
+        last_modified = datetime.datetime.fromtimestamp(mtime, datetime.timezone.utc).replace(microsecond=0)
+        return last_modified <= ims
+    
+    def copyfile(self, source, outputfile):
+        """Send static files with socket.sendfile (os.sendfile where available) instead of copying them through Python.
+        
+        The copy is bounded by the Content-Length already sent, so a file that grew since
+        it was stat'ed can't spill into the next response on a kept-alive connection.
+        """
+        size, self.sendfile_size = self.sendfile_size, None
+        if outputfile is self.wfile and size is not None:
+            sent = self.connection.sendfile(source, count=size) if size else 0  # count must be positive
+            if sent < size:
+                # The file shrank: the body is shorter than its Content-Length, so end the connection
+                self.close_connection = True
+        else:
+            super().copyfile(source, outputfile)
+    
     def do_POST(self):
         parsed_path = urlparse(self.path)
         
         if parsed_path.path == '/api/save_labels':
             self.handle_save_labels_api()
         elif parsed_path.path == '/api/clear_labels':
+            self.discard_request_body()
             self.handle_clear_labels_api()
         else:
+            self.discard_request_body()
             self.send_error(404, "Endpoint not found")
     
+    def discard_request_body(self):
+        """Read and drop an unused request body so the next request on the connection starts clean"""
+        content_length = int(self.headers.get('Content-Length') or 0)
+        if content_length > 0:
+            self.rfile.read(content_length)
+    
     def handle_save_labels_api(self):
         """Save human evaluation labels for an attempt"""
         try:
             # Get request body
             content_length = int(self.headers['Content-Length'])
             post_data = self.rfile.read(content_length)
-            labels_data = json.loads(post_data.decode('utf-8'))
+            labels_data = json_loads(post_data)
             
             # Create labels directory if it doesn't exist
             labels_dir = os.path.join(os.path.dirname(self.data_dir), "human_labels")
             os.makedirs(labels_dir, exist_ok=True)
             
-            # Save labels to file
+            # Save labels to file, encoded up front and written in one call; kept indented
+            # since the label files are versioned and read by people
             labels_file = os.path.join(labels_dir, f"labels_{labels_data['attemptId']}.json")
-            with open(labels_file, 'w', encoding='utf-8') as f:
-                json.dump(labels_data, f, indent=2, ensure_ascii=False)
+            body = json_dumps(labels_data, indent=True)
+            with open(labels_file, 'wb') as f:
+                f.write(body)
             
             self.send_json_response({"success": True, "message": "Labels saved successfully"})
             
@@ -88,16 +385,21 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
             labels = {}
             
             if os.path.exists(labels_dir):
-                for filename in os.listdir(labels_dir):
-                    if filename.startswith('labels_') and filename.endswith('.json'):
-                        attempt_id = filename.replace('labels_', '').replace('.json', '')
-                        file_path = os.path.join(labels_dir, filename)
-                        
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                labels[attempt_id] = json.load(f)
-                        except Exception as e:
-                            print(f"Error reading labels file {filename}: {str(e)}")
+                # One directory read; DirEntry carries the full path and the file type
+                with os.scandir(labels_dir) as it:
+                    label_entries = [entry for entry in it
+                                     if entry.name.startswith('labels_') and entry.name.endswith('.json')
+                                     and entry.is_file()]
+                
+                for entry in label_entries:
+                    filename = entry.name
+                    attempt_id = filename.replace('labels_', '').replace('.json', '')
+                    
+                    try:
+                        with open(entry.path, 'rb') as f:
+                            labels[attempt_id] = json_loads(f.read())
+                    except Exception as e:
+                        print(f"Error reading labels file {filename}: {str(e)}")
             
             self.send_json_response(labels)
             
@@ -107,42 +409,27 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
     def handle_attempts_api(self):
         """Return list of all attempts with basic metadata"""
         try:
-            attempts = []
-            
             # Scan for attempt folders
-            attempt_dirs = glob.glob(os.path.join(self.data_dir, "attempt_*"))
+            attempt_dirs = sorted(glob.glob(os.path.join(self.data_dir, "attempt_*")))
             
-            for attempt_dir in sorted(attempt_dirs):
-                attempt_id = os.path.basename(attempt_dir)
-                attempt_num = attempt_id.replace('attempt_', '')
-                
-                # Extract gene name from report files
-                gene_name = self.extract_gene_name(attempt_dir)
-                
-                # Find evidence figures (comprehensive, single cell, segmentation, etc.)
-                comprehensive_figures = self.find_comprehensive_figures(attempt_dir)
-                
-                # Find report file
-                report_path = self.find_report_file(attempt_dir)
-                
-                # Extract research hypothesis as title
-                research_hypothesis = self.extract_research_hypothesis(attempt_dir, report_path)
-                
-                # Calculate quality scores
-                quality_scores = self.calculate_quality_scores(attempt_dir, report_path)
-                
-                attempts.append({
-                    'id': attempt_id,
-                    'name': f'Attempt {attempt_num}',
-                    'gene': gene_name,
-                    'reportPath': report_path,
-                    'comprehensiveFigures': comprehensive_figures,
-                    'attemptNumber': attempt_num,
-                    'researchHypothesis': research_hypothesis,
-                    'scores': quality_scores
-                })
+            # List each attempt tree once for all helpers below
+            scans = [scan_attempt(attempt_dir) for attempt_dir in attempt_dirs]
+            
+            # Serve the previously built response while no attempt directory or report changed
+            signature = attempts_signature(attempt_dirs, scans)
+            cached = _ATTEMPTS_CACHE.get(self.data_dir)
+            if cached is not None and cached[0] == signature:
+                self.send_json_body(cached[1], cached[2])
+                return
+            
+            # Build the attempts concurrently so that slow report reads overlap
+            with ThreadPoolExecutor(max_workers=max(1, min(ATTEMPT_BUILD_WORKERS, len(attempt_dirs)))) as executor:
+                attempts = list(executor.map(self.build_attempt, attempt_dirs, scans))
             
-            self.send_json_response(attempts)
+            body = json_dumps(attempts)
+            gzipped_body = gzip.compress(body, 6)
+            _ATTEMPTS_CACHE[self.data_dir] = (signature, body, gzipped_body)
+            self.send_json_body(body, gzipped_body)
             
         except Exception as e:
             import traceback
@@ -151,6 +438,40 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
             print(f"Traceback: {error_details}")
             self.send_error_response(f"Error loading attempts: {str(e)}")
     
+    def build_attempt(self, attempt_dir, scan):
+        """Build the /api/attempts entry for one attempt directory"""
+        attempt_id = os.path.basename(attempt_dir)
+        attempt_num = attempt_id.replace('attempt_', '')
+        
+        # Extract gene name from report files
+        gene_name = scan_memo(scan, 'gene_name', self.extract_gene_name, attempt_dir, scan)
+        
+        # Find evidence figures (comprehensive, single cell, segmentation, etc.)
+        comprehensive_figures = scan_memo(scan, 'figures', self.find_comprehensive_figures, scan)
+        
+        # Find report file
+        report_path = self.find_report_file(scan)
+        
+        # Read the report once for the hypothesis and the scores
+        report_content = self.read_report(attempt_dir, report_path)
+        
+        # Extract research hypothesis as title
+        research_hypothesis = self.extract_research_hypothesis(report_content)
+        
+        # Calculate quality scores
+        quality_scores = self.calculate_quality_scores(report_content)
+        
+        return {
+            'id': attempt_id,
+            'name': f'Attempt {attempt_num}',
+            'gene': gene_name,
+            'reportPath': report_path,
+            'comprehensiveFigures': comprehensive_figures,
+            'attemptNumber': attempt_num,
+            'researchHypothesis': research_hypothesis,
+            'scores': quality_scores
+        }
+    
     def handle_attempt_details_api(self, attempt_id):
         """Return detailed information for a specific attempt"""
         try:
@@ -160,12 +481,13 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
                 self.send_error_response(f"Attempt {attempt_id} not found")
                 return
             
-            gene_name = self.extract_gene_name(attempt_dir)
-            comprehensive_figures = self.find_comprehensive_figures(attempt_dir)
-            report_path = self.find_report_file(attempt_dir)
+            scan = scan_attempt(attempt_dir)
+            gene_name = scan_memo(scan, 'gene_name', self.extract_gene_name, attempt_dir, scan)
+            comprehensive_figures = scan_memo(scan, 'figures', self.find_comprehensive_figures, scan)
+            report_path = self.find_report_file(scan)
             
             # Read report summary if available
-            report_summary = self.extract_report_summary(attempt_dir, report_path)
+            report_summary = self.extract_report_summary(self.read_report(attempt_dir, report_path))
             
             details = {
                 'id': attempt_id,
@@ -173,7 +495,7 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
                 'reportPath': report_path,
                 'comprehensiveFigures': comprehensive_figures,
                 'summary': report_summary,
-                'files': self.list_attempt_files(attempt_dir)
+                'files': self.list_attempt_files(scan)
             }
             
             self.send_json_response(details)
@@ -181,116 +503,80 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
         except Exception as e:
             self.send_error_response(f"Error loading attempt details: {str(e)}")
     
-    def extract_gene_name(self, attempt_dir):
+    def extract_gene_name(self, attempt_dir, scan):
         """Extract gene name from report files or directory contents"""
         # Try to find gene name from report file names first
-        report_files = glob.glob(os.path.join(attempt_dir, "report_*.md"))
-        
-        for report_file in report_files:
-            filename = os.path.basename(report_file)
+        for filename in report_file_names(scan):
             # Pattern: report_GENENAME_description.md
-            match = re.search(r'report_([A-Z0-9]+)_', filename)
+            match = REPORT_GENE_RE.search(filename)
             if match:
                 return match.group(1)
         
         # If no report files or gene name not found, analyze file prefixes
-        gene_from_prefix = self.extract_gene_from_file_prefixes(attempt_dir)
+        gene_from_prefix = self.extract_gene_from_file_prefixes(scan)
         if gene_from_prefix:
             return gene_from_prefix
         
         # Fallback: look for gene names in other files
-        all_files = os.listdir(attempt_dir)
-        
-        # Common gene name patterns
-        gene_patterns = [
-            r'([A-Z][A-Z0-9]{2,8})_',  # Standard gene names
-            r'([A-Z]{3,8})_'           # Alternative patterns
-        ]
-        
-        for filename in all_files:
-            for pattern in gene_patterns:
-                match = re.search(pattern, filename)
+        for filename in scan['top']:
+            for pattern in GENE_PATTERNS:
+                match = pattern.search(filename)
                 if match:
                     gene_candidate = match.group(1)
                     # Filter out common false positives
-                    if gene_candidate not in ['JUMP', 'RESEARCH', 'PROBLEM', 'VERIFIED']:
+                    if gene_candidate not in GENE_NAME_BLACKLIST:
                         return gene_candidate
         
         # Final fallback
         attempt_num = os.path.basename(attempt_dir).replace('attempt_', '')
         return f"Gene_{attempt_num}"
     
-    def extract_gene_from_file_prefixes(self, attempt_dir):
+    def extract_gene_from_file_prefixes(self, scan):
         """Extract gene name from most common prefix in CSV/PNG files"""
-        relevant_files = []
-        
-        # Walk through directory to find CSV and PNG files
-        for root, dirs, files in os.walk(attempt_dir):
-            for file in files:
-                if file.lower().endswith(('.csv', '.png')):
-                    relevant_files.append(file)
+        # CSV and PNG files anywhere in the attempt tree
+        relevant_files = [file for _, file in scan['files'] if file.lower().endswith(('.csv', '.png'))]
         
-        if not relevant_files:
-            return None
+        # Potential gene prefixes (before the first underscore) that look like gene names:
+        # 2-10 alphanumeric chars, uppercased for consistency, minus common non-gene prefixes
+        candidates = (prefix for prefix in map(file_name_prefix, relevant_files)
+                      if 2 <= len(prefix) <= 10 and prefix.isalnum())
+        prefix_counts = Counter(prefix for prefix in map(str.upper, candidates)
+                                if prefix not in PREFIX_BLACKLIST)
         
-        # Extract potential gene prefixes (before first underscore or dot)
-        prefixes = []
-        for filename in relevant_files:
-            # Remove extension and get prefix before first underscore
-            base_name = os.path.splitext(filename)[0]
-            if '_' in base_name:
-                prefix = base_name.split('_')[0]
-            else:
-                prefix = base_name
-            
-            # Only consider prefixes that look like gene names (2-10 chars, mostly uppercase)
-            if 2 <= len(prefix) <= 10 and prefix.isalnum():
-                # Convert to uppercase for consistency
-                prefix_upper = prefix.upper()
-                # Filter out common non-gene prefixes
-                if prefix_upper not in ['TOP', 'ALL', 'CELL', 'IMAGE', 'DATA', 'RESULT', 'ANALYSIS', 
-                                       'FIGURE', 'TABLE', 'PLOT', 'GRAPH', 'CHART', 'SUMMARY']:
-                    prefixes.append(prefix_upper)
-        
-        if not prefixes:
+        if not prefix_counts:
             return None
         
-        # Count occurrences and find most common
-        from collections import Counter
-        prefix_counts = Counter(prefixes)
-        
-        # Get most common prefix that appears in at least 2 files
-        for prefix, count in prefix_counts.most_common():
-            if count >= 2:  # Must appear in at least 2 files
-                return prefix
-        
-        # If no prefix appears twice, return the most common one
-        if prefix_counts:
-            return prefix_counts.most_common(1)[0][0]
-        
-        return None
+        # Most common prefix; ties go to the prefix seen first
+        return prefix_counts.most_common(1)[0][0]
     
-    def extract_research_hypothesis(self, attempt_dir, report_path):
-        """Extract research hypothesis from report file"""
+    def read_report(self, attempt_dir, report_path):
+        """Return the report text, or None if there is no report or it can't be read"""
         if not report_path:
             return None
         
         try:
             full_path = os.path.join(attempt_dir, report_path)
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+            st = os.stat(full_path)
+            return _load_report(full_path, st.st_mtime_ns, st.st_size)
+        except Exception:
+            return None
+    
+    def extract_research_hypothesis(self, content):
+        """Extract research hypothesis from report text"""
+        if content is None:
+            return None
+        
+        try:
             # Look for research hypothesis section
             lines = content.split('\n')
-            for i, line in enumerate(lines):
+            
+            # Line by line search for headers, skipped when no header phrase occurs anywhere
+            content_lower = content.lower()
+            has_header = any(phrase in content_lower for phrase in HYPOTHESIS_PHRASES)
+            for i, line in enumerate(lines if has_header else ()):
                 # Check for research hypothesis headers
-                if any(phrase in line.lower() for phrase in [
-                    'research hypothesis', 
-                    '# research hypothesis',
-                    '## research hypothesis',
-                    'hypothesis:',
-                    'research question'
-                ]):
+                line_lower = line.lower()
+                if any(phrase in line_lower for phrase in HYPOTHESIS_PHRASES):
                     # Get the next non-empty line after the header
                     for j in range(i + 1, min(i + 10, len(lines))):
                         next_line = lines[j].strip()
@@ -305,7 +591,8 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
             for i, line in enumerate(lines):
                 if line.strip() and not line.startswith('#'):
                     # Skip metadata lines
-                    if not any(keyword in line.lower() for keyword in ['date:', 'author:', 'version:']):
+                    line_lower = line.lower()
+                    if not any(keyword in line_lower for keyword in ('date:', 'author:', 'version:')):
                         cleaned = line.strip().replace('**', '').replace('*', '')
                         if len(cleaned) > 30 and not cleaned.startswith('Investigation'):
                             return cleaned
@@ -315,53 +602,52 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
         except Exception:
             return None
     
-    def find_comprehensive_figures(self, attempt_dir):
+    def find_comprehensive_figures(self, scan):
         """Find all evidence figures (comprehensive, single, cell, segmentation, composite, comparison) at any level of hierarchy"""
         figures = []
         
-        # Keywords to search for in PNG filenames
-        search_keywords = ['comprehensive', 'single', 'cell', 'segmentation', 'composite', 'comparison']
-        
-        # Walk through all subdirectories to find PNG files with keywords
-        for root, dirs, files in os.walk(attempt_dir):
-            for file in files:
-                # Check if it's a PNG file with any of the keywords in the name
-                if file.lower().endswith('.png'):
-                    file_lower = file.lower()
-                    if any(keyword in file_lower for keyword in search_keywords):
-                        full_path = os.path.join(root, file)
-                        # Create web-accessible path from the working directory
-                        rel_path = os.path.relpath(full_path, os.path.dirname(self.data_dir))
-                        figures.append(rel_path)
+        # Web-accessible path of each directory relative to the working directory, computed once per directory
+        web_root = os.path.dirname(self.data_dir)
+        rel_roots = {}
+        
+        # Check every file in the attempt tree for PNG files with keywords
+        for root, file in scan['files']:
+            # Check if it's a PNG file with any of the keywords in the name
+            file_lower = file.lower()
+            if file_lower.endswith('.png') and any(keyword in file_lower for keyword in FIGURE_KEYWORDS):
+                rel_root = rel_roots.get(root)
+                if rel_root is None:
+                    rel_root = rel_roots[root] = os.path.relpath(root, web_root)
+                figures.append(file if rel_root == '.' else os.path.join(rel_root, file))
         
         # Sort for consistent ordering
         figures.sort()
         
         return figures
     
-    def find_report_file(self, attempt_dir):
+    def find_report_file(self, scan):
         """Find the main report markdown file"""
-        report_files = glob.glob(os.path.join(attempt_dir, "report_*.md"))
+        report_files = report_file_names(scan)
         
         if report_files:
             # Return just the filename for proper URL construction
-            return os.path.basename(report_files[0])
+            return report_files[0]
         
         # Return null if no report file found
         return None
     
-    def extract_report_summary(self, attempt_dir, report_path):
-        """Extract summary from the report file"""
-        if not report_path:
+    def extract_report_summary(self, content):
+        """Extract summary from report text"""
+        if content is None:
             return None
         
         try:
-            full_path = os.path.join(attempt_dir, report_path)
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Look for executive summary or first few paragraphs
-            lines = content.split('\n')
+            # Look for executive summary, starting from the first line with a summary header
+            header_positions = [pos for pos in (content.find('## Executive Summary'), content.find('## Summary')) if pos >= 0]
+            if not header_positions:
+                return None
+            start = content.rfind('\n', 0, min(header_positions)) + 1
+            lines = content[start:].split('\n')
             summary_lines = []
             in_summary = False
             
@@ -381,27 +667,30 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
         except Exception:
             return None
     
-    def calculate_quality_scores(self, attempt_dir, report_path):
+    def calculate_quality_scores(self, content):
         """Calculate quality scores based on report content"""
-        if not report_path:
+        if content is None:
             return {"overall": 50, "confidence": 50, "novelty": 50, "evidence": 50}
         
         try:
-            full_path = os.path.join(attempt_dir, report_path)
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read().lower()
+            content = content.lower()
+            
+            # Each keyword is looked up once; substring search beats a single regex pass over all keywords
+            has_p_value = 'p <' in content or 'p<' in content
+            has_comprehensive = 'comprehensive' in content
             
             # Calculate confidence score based on statistical significance
             confidence = 30
-            if 'p <' in content or 'p<' in content:
+            if has_p_value:
                 confidence += 20
             if 'significant' in content:
                 confidence += 15
-            if 'p < 0.05' in content or 'p<0.05' in content:
+            # Thresholds can only appear where a p-value does
+            if has_p_value and ('p < 0.05' in content or 'p<0.05' in content):
                 confidence += 10
-            if 'p < 0.01' in content or 'p<0.01' in content:
+            if has_p_value and ('p < 0.01' in content or 'p<0.01' in content):
                 confidence += 15
-            if 'comprehensive' in content:
+            if has_comprehensive:
                 confidence += 10
             
             # Calculate novelty score based on research terms
@@ -425,7 +714,7 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
                 evidence += 15
             if 'validation' in content:
                 evidence += 10
-            if 'comprehensive' in content:
+            if has_comprehensive:
                 evidence += 15
             if 'statistical' in content:
                 evidence += 10
@@ -446,17 +735,12 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
             # Default scores if parsing fails
             return {"overall": 50, "confidence": 50, "novelty": 50, "evidence": 50}
     
-    def list_attempt_files(self, attempt_dir):
+    def list_attempt_files(self, scan):
         """List relevant files in the attempt directory"""
         try:
-            all_files = os.listdir(attempt_dir)
-            
-            # Filter for relevant file types
-            relevant_files = []
-            for filename in all_files:
-                if any(filename.endswith(ext) for ext in ['.png', '.jpg', '.md', '.csv', '.json']):
-                    if not filename.startswith('.'):  # Skip hidden files
-                        relevant_files.append(filename)
+            # Filter for relevant file types, skipping hidden files
+            relevant_files = [filename for filename in scan['top']
+                              if filename.endswith(ATTEMPT_FILE_EXTENSIONS) and not filename.startswith('.')]
             
             return sorted(relevant_files)
             
@@ -465,56 +749,356 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
     
     def send_json_response(self, data):
         """Send JSON response"""
+        self.send_json_body(json_dumps(data))
+    
+    def send_json_body(self, body, gzipped_body=None):
+        """Send an already encoded JSON response body"""
+        self.send_body(body, 'application/json', gzipped_body)
+    
+    def accepts_gzip(self):
+        """Whether the request's Accept-Encoding allows a gzip-compressed response"""
+        # Quality value per listed coding; an explicit gzip entry overrides '*'
+        qvalues = {}
+        for coding in self.headers.get('Accept-Encoding', '').split(','):
+            name, *params = coding.split(';')
+            q = 1.0
+            for param in params:
+                key, _, value = param.partition('=')
+                if key.strip().lower() == 'q':
+                    try:
+                        q = float(value.strip())
+                    except ValueError:
+                        q = 0.0  # Unreadable weight: don't rely on the coding
+            qvalues[name.strip().lower()] = q
+        
+        q = qvalues.get('gzip', qvalues.get('*', 0.0))
+        return q > 0  # "gzip;q=0" explicitly refuses gzip
+    
+    def send_body(self, body, content_type, gzipped_body=None):
+        """Send a 200 response, gzip-compressed if the client accepts it and the body is large enough.
+        
+        gzipped_body is a precompressed copy of body (e.g. kept next to a cached body);
+        without one, the body is compressed on the fly at the fastest level.
+        """
         self.send_response(200)
-        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-type', content_type)
         self.send_header('Access-Control-Allow-Origin', '*')
+        if len(body) >= GZIP_MIN_SIZE:
+            self.send_header('Vary', 'Accept-Encoding')
+            if self.accepts_gzip():
+                body = gzipped_body if gzipped_body is not None else gzip.compress(body, 1)
+                self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
         
-        response = json.dumps(data, indent=2)
-        self.wfile.write(response.encode('utf-8'))
+        self.wfile.write(body)
     
     def send_error_response(self, message):
         """Send error response"""
+        body = json_dumps({'error': message})
         self.send_response(500)
         self.send_header('Content-type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-Length', str(len(body)))
+        # A failed request may have left part of its body unread, so don't reuse the connection
+        self.send_header('Connection', 'close')
         self.end_headers()
         
-        response = json.dumps({'error': message})
-        self.wfile.write(response.encode('utf-8'))
+        self.wfile.write(body)
     
-    def handle_markdown_file(self, path):
-        """Convert markdown file to HTML and serve it"""
+    def handle_markdown_file(self, path, query=''):
+        """Convert markdown file to HTML and serve it, or serve it unconverted for ?raw=1 or Accept: text/markdown"""
         try:
             # Remove leading slash and construct file path
             file_path = path.lstrip('/')
             full_path = os.path.join(os.path.dirname(self.data_dir), file_path)
             
+            page_key = os.path.realpath(full_path)
             if not os.path.exists(full_path):
+                _MARKDOWN_PAGES.pop(page_key, None)  # Report removed
                 self.send_error(404, "Markdown file not found")
                 return
             
-            # Read markdown content
-            with open(full_path, 'r', encoding='utf-8') as f:
-                md_content = f.read()
+            # Clients that render markdown themselves get the file as is, without the HTML page
+            if parse_qs(query).get('raw') == ['1'] or 'text/markdown' in self.headers.get('Accept', ''):
+                self.send_raw_markdown(full_path)
+                return
+            
+            # Reuse the rendered page while the file keeps its mtime and size (and is requested
+            # under the same name, which the page title and header are taken from)
+            st = os.stat(full_path)
+            file_stat = (full_path, st.st_mtime_ns, st.st_size)
+            cached = _MARKDOWN_PAGES.get(page_key)
+            if cached is not None and cached[0] == file_stat:
+                html_page, gzipped_page = cached[1], cached[2]
+            else:
+                # Read markdown content
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    md_content = f.read()
+                
+                # Convert to HTML using simple markdown parser
+                html_content = self.convert_markdown_to_html(md_content)
+                
+                # Extract filename for title
+                filename = os.path.basename(full_path)
+                title = filename.replace('_', ' ').replace('.md', '').title()
+                
+                # Create complete HTML page: only the per-report parts are encoded, then joined
+                # with the pre-encoded shell in one allocation
+                head, after_title, after_filename, tail = REPORT_PAGE_SEGMENTS
+                html_page = b''.join((head, title.encode('utf-8'), after_title, filename.encode('utf-8'),
+                                      after_filename, html_content.encode('utf-8'), tail))
+                gzipped_page = gzip.compress(html_page, 6)
+                cache_store(_MARKDOWN_PAGES, page_key, (file_stat, html_page, gzipped_page),
+                            MARKDOWN_PAGE_CACHE_SIZE)
             
-            # Convert to HTML using simple markdown parser
-            html_content = self.convert_markdown_to_html(md_content)
+            # Send response
+            self.send_body(html_page, 'text/html; charset=utf-8', gzipped_page)
             
-            # Extract filename for title
-            filename = os.path.basename(full_path)
-            title = filename.replace('_', ' ').replace('.md', '').title()
+        except Exception as e:
+            self.send_error_response(f"Error rendering markdown: {str(e)}")
+    
+    def send_raw_markdown(self, full_path):
+        """Send a markdown file unconverted, copied with sendfile"""
+        with open(full_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(200)
+            self.send_header('Content-type', 'text/markdown; charset=utf-8')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Content-Length', str(size))
+            self.end_headers()
+            self.sendfile_size = size
+            self.copyfile(f, self.wfile)
+    
+    def convert_markdown_to_html(self, md_content):
+        """Simple markdown to HTML converter"""
+        return markdown_to_html(md_content)
+
+def markdown_to_html(md_content):
+    """Simple markdown to HTML converter"""
+    html = md_content
+    
+    # Escape HTML entities first
+    html = html.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    if '\x00' in html:
+        # NUL marks code placeholders below; browsers display it as U+FFFD anyway
+        html = html.replace('\x00', '\ufffd')
+    
+    # Plain text only needs its paragraphs wrapped
+    if not MD_SYNTAX_RE.search(html):
+        return plain_text_to_html(html)
+    
+    # Code blocks and inline code (preserve formatting): their contents are set aside
+    # behind \x00<n>\x00 placeholders, skipped by every later pass and put back at the end
+    code_spans = []
+    
+    def stash_code(match):
+        code_spans.append(match.group(1))
+        return f'\x00{len(code_spans) - 1}\x00'
+    
+    html = MD_CODE_BLOCK_RE.sub(lambda match: f'<pre><code>{stash_code(match)}</code></pre>', html)
+    html = MD_INLINE_CODE_RE.sub(lambda match: f'<code>{stash_code(match)}</code>', html)
+    
+    # Headers, all levels in one pass
+    html = MD_HEADER_RE.sub(header_html, html)
+    
+    # Bold and italic (non-greedy)
+    html = MD_BOLD_RE.sub(r'<strong>\1</strong>', html)
+    html = MD_ITALIC_RE.sub(r'<em>\1</em>', html)
+    
+    # Links
+    html = MD_LINK_RE.sub(r'<a href="\2">\1</a>', html)
+    
+    # Tables - handle before lists (but only real markdown tables)
+    lines = convert_proper_markdown_tables(html.split('\n'))
+    
+    # Lists and paragraphs in one pass over the lines. Table conversion has already
+    # stripped every line, and a list is only ever open right after an item, so
+    # closing one never leaves a pending paragraph behind.
+    open_list = None  # 'ul' or 'ol' while a list is open
+    result_lines = []
+    current_para = []
+    
+    for line in lines:
+        # List items are told apart by their prefix; str.isdecimal() accepts the same digits as \d
+        if line[:2] in MD_UL_MARKERS:
+            list_tag, item = 'ul', line[2:]
+        else:
+            ordered_dot = line.find('. ') if line[:1].isdecimal() else -1
+            if ordered_dot > 0 and line[:ordered_dot].isdecimal():
+                list_tag, item = 'ol', line[ordered_dot + 2:]
+            else:
+                list_tag = None
+        
+        if list_tag is not None:
+            if current_para:
+                result_lines.append(f'<p>{" ".join(current_para)}</p>')
+                current_para = []
+            # Open the list, closing the other kind if it is open
+            if open_list != list_tag:
+                if open_list is not None:
+                    result_lines.append(f'</{open_list}>')
+                result_lines.append(f'<{list_tag}>')
+                open_list = list_tag
+            result_lines.append(f'<li>{item}</li>')
+            continue
+        
+        # Close any open list
+        if open_list is not None:
+            result_lines.append(f'</{open_list}>')
+            open_list = None
+        
+        if not line or line[0] == '<':
+            # Empty lines and HTML tags (headers, tables, etc.) end the paragraph
+            if current_para:
+                result_lines.append(f'<p>{" ".join(current_para)}</p>')
+                current_para = []
+            result_lines.append(line)
+        else:
+            # Regular text - accumulate for paragraph
+            current_para.append(line)
+    
+    # Close any remaining open list or paragraph
+    if open_list is not None:
+        result_lines.append(f'</{open_list}>')
+    if current_para:
+        result_lines.append(f'<p>{" ".join(current_para)}</p>')
+    
+    html = '\n'.join(result_lines)
+    
+    # Clean up multiple empty lines
+    html = MD_BLANK_LINES_RE.sub('\n\n', html)
+    
+    # Put the code back
+    if code_spans:
+        html = MD_CODE_PLACEHOLDER_RE.sub(lambda match: code_spans[int(match.group(1))], html)
+    
+    return html
+
+def plain_text_to_html(html):
+    """Wrap escaped text without markdown syntax in paragraphs, as markdown_to_html would"""
+    result_lines = []
+    current_para = []
+    
+    for line in html.split('\n'):
+        line = line.strip()
+        if line:
+            current_para.append(line)
+            continue
+        
+        # Empty lines end the paragraph
+        if current_para:
+            result_lines.append(f'<p>{" ".join(current_para)}</p>')
+            current_para = []
+        result_lines.append('')
+    
+    if current_para:
+        result_lines.append(f'<p>{" ".join(current_para)}</p>')
+    
+    return MD_BLANK_LINES_RE.sub('\n\n', '\n'.join(result_lines))
+
+def convert_proper_markdown_tables(lines):
+    """Convert only properly formatted markdown tables to HTML tables; returns the stripped output lines"""
+    result_lines = []
+    i = 0
+    
+    while i < len(lines):
+        line = lines[i].strip()
+        
+        # Very strict detection: only process if we have a clear markdown table
+        if ('|' in line and line.count('|') >= 3 and  # Must have at least 3 pipes (start|col|col|end)
+            '+' not in line and  # No ASCII art
+            line.count('-') < 10):  # Not a separator line itself
             
-            # Create complete HTML page
-            html_page = f"""
+            # Check if next line is a proper markdown table separator
+            if (i + 1 < len(lines)):
+                next_line = lines[i + 1].strip()
+                
+                # Very specific pattern for markdown table separator
+                if (next_line.startswith('|') and next_line.endswith('|') and 
+                    next_line.count('-') >= 3 and 
+                    MD_TABLE_SEPARATOR_RE.match(next_line)):
+                    
+                    # Check if we have at least one data row after separator
+                    if (i + 2 < len(lines) and '|' in lines[i + 2] and 
+                        lines[i + 2].count('|') >= 3):
+                        
+                        # This looks like a real table - parse it
+                        table_html, lines_consumed = parse_markdown_table(lines, i)
+                        if table_html is not None:  # Only if parsing succeeded
+                            result_lines.extend(table_html)
+                            i += lines_consumed
+                            continue
+        
+        result_lines.append(line)
+        i += 1
+    
+    return result_lines
+
+def parse_markdown_table(lines, start_index):
+    """Parse a markdown table already validated by convert_proper_markdown_tables.
+    
+    Returns (HTML lines, number of markdown lines consumed), or (None, 1) if
+    fewer than three table lines follow.
+    """
+    table_lines = []
+    
+    # Collect table lines until we hit an empty line or non-table line
+    i = start_index
+    while i < len(lines):
+        line = lines[i].strip()
+        if not line:
+            break  # Empty line ends table
+        if '|' not in line or line.count('|') < 3:
+            break  # Not a table line
+        table_lines.append(line)
+        i += 1
+    
+    lines_consumed = len(table_lines)
+    
+    if lines_consumed < 3:  # Need header + separator + at least one data row
+        return None, 1
+    
+    # Extract header
+    header_line = table_lines[0]
+    header_line = header_line.strip('|').strip()
+    headers = [cell.strip() for cell in header_line.split('|')]
+    
+    # Skip separator line (index 1)
+    
+    # Extract data rows
+    data_rows = []
+    for row_line in table_lines[2:]:
+        row_line = row_line.strip('|').strip()
+        cells = [cell.strip() for cell in row_line.split('|')]
+        
+        # Ensure same number of cells as headers
+        while len(cells) < len(headers):
+            cells.append('')
+        data_rows.append(cells[:len(headers)])
+    
+    # Generate HTML, one tag per line
+    html_parts = ['<table>', '<thead>', '<tr>']
+    html_parts += [f'<th>{header}</th>' for header in headers]
+    html_parts += ['</tr>', '</thead>', '<tbody>']
+    for row in data_rows:
+        html_parts.append('<tr>')
+        html_parts += [f'<td>{cell}</td>' for cell in row]
+        html_parts.append('</tr>')
+    html_parts += ['</tbody>', '</table>']
+    
+    return html_parts, lines_consumed
+
+# Page shell for rendered markdown reports; $title, $filename and $html_content are filled in per report
+REPORT_PAGE_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - JUMP Discovery Report</title>
+    <title>$title - JUMP Discovery Report</title>
     <style>
-        :root {{
+        :root {
             --primary-bg: #0a0f1e;
             --secondary-bg: #1a2332;
             --accent-bg: #2d3f5f;
@@ -529,49 +1113,49 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
             --warning: #ff9800;
             --danger: #f44336;
             --shadow: rgba(0, 0, 0, 0.4);
-        }}
+        }
         
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, var(--primary-bg) 0%, var(--secondary-bg) 50%, var(--accent-bg) 100%);
             color: var(--text-primary);
             line-height: 1.6;
             min-height: 100vh;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
-        .header {{
+        .header {
             background: var(--panel-bg);
             padding: 20px;
             border-radius: 12px;
             margin-bottom: 30px;
             border: 2px solid var(--border-color);
             box-shadow: 0 8px 32px var(--shadow);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             color: var(--accent-blue);
             font-size: 28px;
             margin-bottom: 10px;
-        }}
+        }
         
-        .header .meta {{
+        .header .meta {
             color: var(--text-muted);
             font-size: 14px;
-        }}
+        }
         
-        .back-btn {{
+        .back-btn {
             display: inline-block;
             background: var(--accent-bg);
             color: var(--text-primary);
@@ -581,15 +1165,15 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
             margin-bottom: 20px;
             transition: all 0.3s ease;
             border: 1px solid var(--border-color);
-        }}
+        }
         
-        .back-btn:hover {{
+        .back-btn:hover {
             background: var(--accent-blue);
             transform: translateY(-2px);
             box-shadow: 0 4px 12px var(--shadow);
-        }}
+        }
         
-        .content {{
+        .content {
             background: var(--panel-bg);
             padding: 30px;
             border-radius: 12px;
@@ -597,197 +1181,197 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
             box-shadow: 0 8px 32px var(--shadow);
             text-align: left;
             direction: ltr;
-        }}
+        }
         
-        .content * {{
+        .content * {
             text-align: left !important;
             margin-left: 0 !important;
-        }}
+        }
         
-        .content p {{
+        .content p {
             line-height: 1.7;
             margin-bottom: 16px;
-        }}
+        }
         
-        .content h1, .content h2, .content h3, .content h4 {{
+        .content h1, .content h2, .content h3, .content h4 {
             margin-top: 24px;
             margin-bottom: 16px;
             line-height: 1.3;
-        }}
+        }
         
         .content h1:first-child, .content h2:first-child, 
-        .content h3:first-child, .content h4:first-child {{
+        .content h3:first-child, .content h4:first-child {
             margin-top: 0;
-        }}
+        }
         
-        .content h1 {{
+        .content h1 {
             color: var(--accent-blue);
             font-size: 32px;
             margin-bottom: 20px;
             border-bottom: 3px solid var(--accent-blue);
             padding-bottom: 10px;
-        }}
+        }
         
-        .content h2 {{
+        .content h2 {
             color: var(--accent-gold);
             font-size: 24px;
             margin: 30px 0 15px 0;
             border-left: 4px solid var(--accent-gold);
             padding-left: 15px;
-        }}
+        }
         
-        .content h3 {{
+        .content h3 {
             color: var(--text-primary);
             font-size: 20px;
             margin: 25px 0 10px 0;
-        }}
+        }
         
-        .content h4 {{
+        .content h4 {
             color: var(--text-secondary);
             font-size: 18px;
             margin: 20px 0 8px 0;
-        }}
+        }
         
-        .content p {{
+        .content p {
             margin-bottom: 15px;
             color: var(--text-secondary);
-        }}
+        }
         
-        .content ul, .content ol {{
+        .content ul, .content ol {
             margin-bottom: 15px;
             padding-left: 30px;
             color: var(--text-secondary);
             text-align: left;
             margin-left: 0;
-        }}
+        }
         
-        .content li {{
+        .content li {
             margin-bottom: 8px;
             text-align: left;
             list-style-position: inside;
-        }}
+        }
         
-        .content ol {{
+        .content ol {
             counter-reset: item;
-        }}
+        }
         
-        .content ol li {{
+        .content ol li {
             display: block;
             margin-bottom: 0.5em;
             margin-left: 0;
-        }}
+        }
         
-        .content ol li:before {{
+        .content ol li:before {
             content: counter(item, decimal) ". ";
             counter-increment: item;
             font-weight: bold;
             color: var(--accent-gold);
-        }}
+        }
         
-        .content strong {{
+        .content strong {
             color: var(--text-primary);
             font-weight: 600;
-        }}
+        }
         
-        .content code {{
+        .content code {
             background: var(--accent-bg);
             color: var(--accent-gold);
             padding: 2px 6px;
             border-radius: 4px;
             font-family: 'Monaco', 'Consolas', monospace;
-        }}
+        }
         
-        .content pre {{
+        .content pre {
             background: var(--accent-bg);
             padding: 20px;
             border-radius: 8px;
             overflow-x: auto;
             margin: 20px 0;
             border: 1px solid var(--border-color);
-        }}
+        }
         
-        .content pre code {{
+        .content pre code {
             background: none;
             padding: 0;
-        }}
+        }
         
-        .content blockquote {{
+        .content blockquote {
             border-left: 4px solid var(--accent-blue);
             background: var(--accent-bg);
             padding: 15px 20px;
             margin: 20px 0;
             border-radius: 0 8px 8px 0;
             font-style: italic;
-        }}
+        }
         
-        .content table {{
+        .content table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
             background: var(--secondary-bg);
             border-radius: 8px;
             overflow: hidden;
-        }}
+        }
         
-        .content th, .content td {{
+        .content th, .content td {
             padding: 12px 15px;
             text-align: left;
             border-bottom: 1px solid var(--border-color);
-        }}
+        }
         
-        .content th {{
+        .content th {
             background: var(--accent-bg);
             color: var(--text-primary);
             font-weight: 600;
-        }}
+        }
         
-        .content td {{
+        .content td {
             color: var(--text-secondary);
-        }}
+        }
         
-        .content a {{
+        .content a {
             color: var(--accent-blue);
             text-decoration: none;
             border-bottom: 1px dotted var(--accent-blue);
-        }}
+        }
         
-        .content a:hover {{
+        .content a:hover {
             color: var(--accent-gold);
             border-bottom-color: var(--accent-gold);
-        }}
+        }
         
-        .content hr {{
+        .content hr {
             border: none;
             height: 2px;
             background: linear-gradient(to right, transparent, var(--border-color), transparent);
             margin: 30px 0;
-        }}
+        }
         
-        .highlight {{
+        .highlight {
             background: var(--accent-bg);
             padding: 3px 8px;
             border-radius: 4px;
             color: var(--accent-gold);
             font-weight: 600;
-        }}
+        }
         
-        ::-webkit-scrollbar {{
+        ::-webkit-scrollbar {
             width: 12px;
-        }}
+        }
         
-        ::-webkit-scrollbar-track {{
+        ::-webkit-scrollbar-track {
             background: var(--accent-bg);
             border-radius: 6px;
-        }}
+        }
         
-        ::-webkit-scrollbar-thumb {{
+        ::-webkit-scrollbar-thumb {
             background: var(--border-color);
             border-radius: 6px;
-        }}
+        }
         
-        ::-webkit-scrollbar-thumb:hover {{
+        ::-webkit-scrollbar-thumb:hover {
             background: var(--accent-blue);
-        }}
+        }
     </style>
 </head>
 <body>
@@ -796,404 +1380,37 @@ class JUMPVisualizerHandler(SimpleHTTPRequestHandler):
         
         <div class="header">
             <h1>📊 JUMP Discovery Report</h1>
-            <div class="meta">Research Analysis • {filename}</div>
+            <div class="meta">Research Analysis • $filename</div>
         </div>
         
         <div class="content">
-            {html_content}
+            $html_content
         </div>
     </div>
 </body>
 </html>
 """
-            
-            # Send response
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            self.wfile.write(html_page.encode('utf-8'))
-            
-        except Exception as e:
-            self.send_error_response(f"Error rendering markdown: {str(e)}")
-    
-    def convert_markdown_to_html(self, md_content):
-        """Simple markdown to HTML converter"""
-        html = md_content
-        
-        # Escape HTML entities first
-        html = html.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-        
-        # Headers (more specific patterns)
-        html = re.sub(r'^#### (.*?)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-        html = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-        html = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-        
-        # Bold and italic (non-greedy)
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-        html = re.sub(r'(?<!\*)\*([^*\n]+?)\*(?!\*)', r'<em>\1</em>', html)
-        
-        # Code blocks (preserve formatting)
-        html = re.sub(r'```([^`]*?)```', r'<pre><code>\1</code></pre>', html, flags=re.DOTALL)
-        html = re.sub(r'`([^`]+?)`', r'<code>\1</code>', html)
-        
-        # Links
-        html = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2">\1</a>', html)
-        
-        # Tables - handle before lists (but only real markdown tables)
-        html = self.convert_proper_markdown_tables(html)
-        
-        # Lists - improved handling
-        lines = html.split('\n')
-        in_unordered_list = False
-        in_ordered_list = False
-        result_lines = []
-        
-        for line in lines:
-            # Unordered lists
-            if re.match(r'^[\s]*[-\*\+] ', line):
-                # Close ordered list if open
-                if in_ordered_list:
-                    result_lines.append('</ol>')
-                    in_ordered_list = False
-                # Open unordered list if not already open
-                if not in_unordered_list:
-                    result_lines.append('<ul>')
-                    in_unordered_list = True
-                item = re.sub(r'^[\s]*[-\*\+] (.*)', r'<li>\1</li>', line)
-                result_lines.append(item)
-            # Ordered lists
-            elif re.match(r'^[\s]*\d+\. ', line):
-                # Close unordered list if open
-                if in_unordered_list:
-                    result_lines.append('</ul>')
-                    in_unordered_list = False
-                # Open ordered list if not already open
-                if not in_ordered_list:
-                    result_lines.append('<ol>')
-                    in_ordered_list = True
-                item = re.sub(r'^[\s]*\d+\. (.*)', r'<li>\1</li>', line)
-                result_lines.append(item)
-            else:
-                # Close any open lists
-                if in_unordered_list:
-                    result_lines.append('</ul>')
-                    in_unordered_list = False
-                if in_ordered_list:
-                    result_lines.append('</ol>')
-                    in_ordered_list = False
-                result_lines.append(line)
-        
-        # Close any remaining open lists
-        if in_unordered_list:
-            result_lines.append('</ul>')
-        if in_ordered_list:
-            result_lines.append('</ol>')
-        
-        html = '\n'.join(result_lines)
-        
-        # Paragraphs - better handling
-        lines = html.split('\n')
-        result_lines = []
-        current_para = []
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines
-            if not line:
-                if current_para:
-                    para_text = ' '.join(current_para).strip()
-                    if para_text and not para_text.startswith('<'):
-                        result_lines.append(f'<p>{para_text}</p>')
-                    else:
-                        result_lines.append(para_text)
-                    current_para = []
-                result_lines.append('')
-                continue
-            
-            # HTML tags (headers, lists, etc.) - add directly
-            if line.startswith('<'):
-                if current_para:
-                    para_text = ' '.join(current_para).strip()
-                    if para_text:
-                        result_lines.append(f'<p>{para_text}</p>')
-                    current_para = []
-                result_lines.append(line)
-            else:
-                # Regular text - accumulate for paragraph
-                current_para.append(line)
-        
-        # Handle any remaining paragraph
-        if current_para:
-            para_text = ' '.join(current_para).strip()
-            if para_text:
-                result_lines.append(f'<p>{para_text}</p>')
-        
-        html = '\n'.join(result_lines)
-        
-        # Clean up multiple empty lines
-        html = re.sub(r'\n\s*\n\s*\n+', '\n\n', html)
-        
-        # Horizontal rules
-        html = re.sub(r'^---$', r'<hr>', html, flags=re.MULTILINE)
-        
-        return html
-    
-    def convert_proper_markdown_tables(self, html):
-        """Convert only properly formatted markdown tables to HTML tables"""
-        lines = html.split('\n')
-        result_lines = []
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Very strict detection: only process if we have a clear markdown table
-            if ('|' in line and line.count('|') >= 3 and  # Must have at least 3 pipes (start|col|col|end)
-                not any(char in line for char in ['+']) and  # No ASCII art
-                line.count('-') < 10):  # Not a separator line itself
-                
-                # Check if next line is a proper markdown table separator
-                if (i + 1 < len(lines)):
-                    next_line = lines[i + 1].strip()
-                    
-                    # Very specific pattern for markdown table separator
-                    if (next_line.startswith('|') and next_line.endswith('|') and 
-                        next_line.count('-') >= 3 and 
-                        re.match(r'^\|[\s\-\:\|]+\|$', next_line)):
-                        
-                        # Check if we have at least one data row after separator
-                        if (i + 2 < len(lines) and '|' in lines[i + 2] and 
-                            lines[i + 2].count('|') >= 3):
-                            
-                            # This looks like a real table - parse it
-                            table_html, lines_consumed = self.parse_strict_markdown_table(lines, i)
-                            if table_html != line:  # Only if parsing succeeded
-                                result_lines.append(table_html)
-                                i += lines_consumed
-                                continue
-            
-            result_lines.append(line)
-            i += 1
-        
-        return '\n'.join(result_lines)
-    
-    def parse_strict_markdown_table(self, lines, start_index):
-        """Parse a strictly validated markdown table"""
-        table_lines = []
-        
-        # Collect table lines until we hit an empty line or non-table line
-        i = start_index
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                break  # Empty line ends table
-            if '|' not in line or line.count('|') < 3:
-                break  # Not a table line
-            table_lines.append(line)
-            i += 1
-        
-        lines_consumed = len(table_lines)
-        
-        if lines_consumed < 3:  # Need header + separator + at least one data row
-            return lines[start_index], 1
-        
-        # Extract header
-        header_line = table_lines[0]
-        header_line = header_line.strip('|').strip()
-        headers = [cell.strip() for cell in header_line.split('|')]
-        
-        # Skip separator line (index 1)
-        
-        # Extract data rows
-        data_rows = []
-        for row_line in table_lines[2:]:
-            row_line = row_line.strip('|').strip()
-            cells = [cell.strip() for cell in row_line.split('|')]
-            
-            # Ensure same number of cells as headers
-            while len(cells) < len(headers):
-                cells.append('')
-            data_rows.append(cells[:len(headers)])
-        
-        # Generate HTML
-        html_parts = ['<table>']
-        html_parts.append('<thead>')
-        html_parts.append('<tr>')
-        for header in headers:
-            html_parts.append(f'<th>{header}</th>')
-        html_parts.append('</tr>')
-        html_parts.append('</thead>')
-        html_parts.append('<tbody>')
-        for row in data_rows:
-            html_parts.append('<tr>')
-            for cell in row:
-                html_parts.append(f'<td>{cell}</td>')
-            html_parts.append('</tr>')
-        html_parts.append('</tbody>')
-        html_parts.append('</table>')
-        
-        return '\n'.join(html_parts), lines_consumed
-    
-    def parse_markdown_table_with_count(self, lines, start_index):
-        """Parse a markdown table and return HTML plus number of lines consumed"""
-        table_lines = []
-        
-        # Collect all table lines
-        i = start_index
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                break  # Empty line ends table
-            if '|' not in line:
-                break  # No pipe means end of table
-            # Don't include lines that are clearly not table data
-            if line.startswith('|---') and line.endswith('---|') and line.count('-') > 10:
-                # This looks like a long separator, might not be a table
-                break
-            table_lines.append(line)
-            i += 1
-        
-        lines_consumed = len(table_lines)
-        
-        if len(table_lines) < 3:  # Need header, separator, and at least one data row
-            return lines[start_index], 1  # Return original line, consume only 1 line
-        
-        # Parse header - handle edge pipes properly
-        header_line = table_lines[0]
-        # Remove leading/trailing pipes if present
-        if header_line.startswith('|'):
-            header_line = header_line[1:]
-        if header_line.endswith('|'):
-            header_line = header_line[:-1]
-        headers = [cell.strip() for cell in header_line.split('|')]
-        
-        # Verify this looks like a real table by checking the separator
-        separator_line = table_lines[1]
-        # More flexible separator validation - must contain dashes and/or pipes
-        if not (('-' in separator_line or '|' in separator_line) and 
-                re.match(r'^[\s\|\-\:]+$', separator_line.strip())):
-            return lines[start_index], 1  # Not a valid table separator
-        
-        # Parse data rows (skip separator line at index 1)
-        data_rows = []
-        for row_line in table_lines[2:]:
-            # Remove leading/trailing pipes if present
-            if row_line.startswith('|'):
-                row_line = row_line[1:]
-            if row_line.endswith('|'):
-                row_line = row_line[:-1]
-            cells = [cell.strip() for cell in row_line.split('|')]
-            
-            # Ensure we have the same number of cells as headers
-            while len(cells) < len(headers):
-                cells.append('')
-            data_rows.append(cells[:len(headers)])  # Truncate if too many cells
-        
-        # Generate HTML table only if we have valid data
-        if not headers or not data_rows:
-            return lines[start_index], 1
-        
-        html_parts = ['<table>']
-        
-        # Table header
-        html_parts.append('<thead>')
-        html_parts.append('<tr>')
-        for header in headers:
-            html_parts.append(f'<th>{header}</th>')
-        html_parts.append('</tr>')
-        html_parts.append('</thead>')
-        
-        # Table body
-        html_parts.append('<tbody>')
-        for row in data_rows:
-            html_parts.append('<tr>')
-            for cell in row:
-                html_parts.append(f'<td>{cell}</td>')
-            html_parts.append('</tr>')
-        html_parts.append('</tbody>')
-        
-        html_parts.append('</table>')
-        
-        return '\n'.join(html_parts), lines_consumed
-    
-    def parse_markdown_table(self, lines, start_index):
-        """Parse a markdown table starting at start_index"""
-        table_lines = []
-        
-        # Collect all table lines - be more careful about what constitutes a table line
-        i = start_index
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                break  # Empty line ends table
-            if '|' not in line:
-                break  # No pipe means end of table
-            # Skip lines that look like ASCII art
-            if any(char in line for char in ['+']) or line.count('-') > line.count('|') * 2:
-                break
-            table_lines.append(line)
-            i += 1
-        
-        if len(table_lines) < 2:
-            return lines[start_index]  # Not a valid table, return original line
-        
-        # Parse header - handle edge pipes properly
-        header_line = table_lines[0]
-        # Remove leading/trailing pipes and split
-        header_line = header_line.strip('|').strip()
-        headers = [cell.strip() for cell in header_line.split('|')]
-        
-        # Skip separator line (table_lines[1]) and validate it
-        if len(table_lines) < 3:
-            return lines[start_index]  # Need at least header, separator, and one data row
-        
-        # Parse data rows
-        data_rows = []
-        for row_line in table_lines[2:]:
-            # Remove leading/trailing pipes and split
-            row_line = row_line.strip('|').strip()
-            cells = [cell.strip() for cell in row_line.split('|')]
-            
-            # Ensure we have the same number of cells as headers
-            while len(cells) < len(headers):
-                cells.append('')
-            data_rows.append(cells[:len(headers)])  # Truncate if too many cells
-        
-        # Generate HTML table only if we have valid data
-        if not headers or not data_rows:
-            return lines[start_index]
-        
-        html_parts = ['<table>']
-        
-        # Table header
-        html_parts.append('<thead>')
-        html_parts.append('<tr>')
-        for header in headers:
-            html_parts.append(f'<th>{header}</th>')
-        html_parts.append('</tr>')
-        html_parts.append('</thead>')
-        
-        # Table body
-        html_parts.append('<tbody>')
-        for row in data_rows:
-            html_parts.append('<tr>')
-            for cell in row:
-                html_parts.append(f'<td>{cell}</td>')
-            html_parts.append('</tr>')
-        html_parts.append('</tbody>')
-        
-        html_parts.append('</table>')
-        
-        return '\n'.join(html_parts)
+
+def split_page_template(template):
+    """Split the page shell at its placeholders into encoded static segments: head, after title, after filename, tail"""
+    segments = []
+    for placeholder in ('$title', '$filename', '$html_content'):
+        segment, _, template = template.partition(placeholder)
+        segments.append(segment.encode('utf-8'))
+    segments.append(template.encode('utf-8'))
+    return tuple(segments)
+
+# Static parts of the page shell, encoded once at import
+REPORT_PAGE_SEGMENTS = split_page_template(REPORT_PAGE_TEMPLATE)
+
+# Rendered report pages as {real path: ((full_path, mtime_ns, size), encoded page, gzipped page)}
+_MARKDOWN_PAGES = {}
+MARKDOWN_PAGE_CACHE_SIZE = 128
 
 def run_server(port=9876):
     """Run the HTTP server"""
     server_address = ('', port)
-    httpd = HTTPServer(server_address, JUMPVisualizerHandler)
+    httpd = ThreadingHTTPServer(server_address, JUMPVisualizerHandler)
     
     print(f"Starting JUMP Discovery Visualizer server on port {port}")
     print(f"Visit: http://localhost:{port}/jump_discovery_visualizer.html")